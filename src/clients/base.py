@@ -2,8 +2,16 @@
 Базовые функции для клиентов внешних сервисов.
 """
 
+import asyncio
 from abc import ABC, abstractmethod
-from typing import Optional
+from contextlib import asynccontextmanager
+from http import HTTPStatus
+from typing import AsyncIterator, Optional
+
+import aiohttp
+
+from logger import trace_config
+from settings import HTTP_CONCURRENCY
 
 
 class BaseClient(ABC):
@@ -11,8 +19,45 @@ class BaseClient(ABC):
     Базовый класс, реализующий интерфейс для клиентов.
     """
 
+    # общая для всех клиентов сессия с пулом соединений
+    _session: Optional[aiohttp.ClientSession] = None
+
+    @staticmethod
+    async def get_session() -> aiohttp.ClientSession:
+        """
+        Получение общей сессии для HTTP-запросов (создается при первом обращении).
+
+        :return:
+        """
+
+        if BaseClient._session is None or BaseClient._session.closed:
+            BaseClient._session = aiohttp.ClientSession(
+                connector=aiohttp.TCPConnector(
+                    # лимиты соединений не должны быть меньше
+                    # количества одновременно выполняемых запросов
+                    limit=max(64, HTTP_CONCURRENCY),
+                    limit_per_host=max(16, HTTP_CONCURRENCY),
+                    keepalive_timeout=75,
+                ),
+                trace_configs=[trace_config],
+            )
+
+        return BaseClient._session
+
+    @staticmethod
+    async def close_session() -> None:
+        """
+        Закрытие общей сессии для HTTP-запросов.
+
+        :return:
+        """
+
+        if BaseClient._session is not None:
+            await BaseClient._session.close()
+            BaseClient._session = None
+
     @abstractmethod
-    async def get_base_url(self) -> str:
+    def get_base_url(self) -> str:
         """
         Получение базового URL для запросов.
 
@@ -20,10 +65,109 @@ class BaseClient(ABC):
         """
 
     @abstractmethod
-    async def _request(self, endpoint: str) -> Optional[dict]:
+    async def _request(
+        self, endpoint: str, params: Optional[dict] = None
+    ) -> Optional[dict]:
         """
         Формирование и выполнение запроса.
 
         :param endpoint:
+        :param params: Параметры строки запроса (кодируются при формировании URL)
+        :return:
+        """
+
+
+class RateLimitedClient:
+    """
+    Примесь для клиентов, учитывающая ограничения частоты запросов внешнего сервиса.
+
+    Количество одновременных запросов регулируется по схеме AIMD:
+    после успешного ответа лимит увеличивается на постоянную величину,
+    а при исчерпании квоты запросов (по заголовкам ответа) – уменьшается кратно.
+    Уменьшение выполняется не чаще одного раза за окно: ответы на запросы,
+    отправленные до предыдущего уменьшения, лимит повторно не снижают.
+    """
+
+    # максимальное количество одновременно выполняемых запросов
+    max_concurrency: int = HTTP_CONCURRENCY
+    # величина увеличения лимита после успешного ответа
+    increase_step: float = 0.5
+    # коэффициент уменьшения лимита при исчерпании квоты запросов
+    decrease_factor: float = 0.5
+    # остаток квоты запросов, при котором необходимо снизить нагрузку
+    remaining_threshold: int = 2
+    # время ожидания (в секундах), если сервис не передал заголовок Retry-After
+    default_retry_after: float = 1.0
+    # количество повторных попыток запроса после ожидания по заголовку Retry-After
+    retry_attempts: int = 1
+
+    def __init__(self) -> None:
+        self._concurrency_limit = float(self.max_concurrency)
+        self._in_flight = 0
+        self._condition = asyncio.Condition()
+        # номер текущего окна, увеличивается при каждом уменьшении лимита
+        self._window = 0
+
+    @asynccontextmanager
+    async def _limited(self) -> AsyncIterator[int]:
+        """
+        Ожидание свободного места в пределах текущего лимита одновременных запросов.
+
+        :return: Номер окна, в котором отправлен запрос
+        """
+
+        async with self._condition:
+            await self._condition.wait_for(
+                lambda: self._in_flight < int(self._concurrency_limit)
+            )
+            self._in_flight += 1
+        try:
+            yield self._window
+        finally:
+            async with self._condition:
+                self._in_flight -= 1
+                self._condition.notify_all()
+
+    async def _throttle(self, response: aiohttp.ClientResponse, window: int) -> None:
+        """
+        Корректировка лимита одновременных запросов по заголовкам ответа.
+
+        :param response: Ответ внешнего сервиса
+        :param window: Номер окна, в котором был отправлен запрос
+        :return:
+        """
+
+        remaining = self._parse_header(response.headers.get("X-RateLimit-Remaining"))
+        if response.status == HTTPStatus.TOO_MANY_REQUESTS or (
+            remaining is not None and remaining <= self.remaining_threshold
+        ):
+            if window == self._window:
+                self._window += 1
+                self._concurrency_limit = max(
+                    1.0, self._concurrency_limit * self.decrease_factor
+                )
+            retry_after = self._parse_header(response.headers.get("Retry-After"))
+            await asyncio.sleep(
+                self.default_retry_after if retry_after is None else retry_after
+            )
+        elif response.status == HTTPStatus.OK:
+            async with self._condition:
+                self._concurrency_limit = min(
+                    float(self.max_concurrency),
+                    self._concurrency_limit + self.increase_step,
+                )
+                self._condition.notify_all()
+
+    @staticmethod
+    def _parse_header(value: Optional[str]) -> Optional[float]:
+        """
+        Получение числового значения заголовка ответа.
+
+        :param value: Значение заголовка
         :return:
         """
+
+        try:
+            return float(value) if value is not None else None
+        except ValueError:
+            return None
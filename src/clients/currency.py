@@ -4,10 +4,7 @@
 from http import HTTPStatus
 from typing import Optional
 
-import aiohttp
-
 from clients.base import BaseClient
-from logger import trace_config
 from settings import API_KEY_APILAYER
 
 
@@ -16,20 +13,22 @@ class CurrencyClient(BaseClient):
     Реализация функций для взаимодействия с внешним сервисом-провайдером данных о курсах валют.
     """
 
-    async def get_base_url(self) -> str:
+    def get_base_url(self) -> str:
         return "https://api.apilayer.com/fixer/latest"
 
-    async def _request(self, endpoint: str) -> Optional[dict]:
+    async def _request(
+        self, endpoint: str, params: Optional[dict] = None
+    ) -> Optional[dict]:
 
         # формирование заголовков запроса
         headers = {"apikey": API_KEY_APILAYER}
 
-        async with aiohttp.ClientSession(trace_configs=[trace_config]) as session:
-            async with session.get(endpoint, headers=headers) as response:
-                if response.status == HTTPStatus.OK:
-                    return await response.json()
+        session = await self.get_session()
+        async with session.get(endpoint, params=params, headers=headers) as response:
+            if response.status == HTTPStatus.OK:
+                return await response.json()
 
-                return None
+            return None
 
     async def get_rates(self, base: str = "rub") -> Optional[dict]:
         """
@@ -39,4 +38,4 @@ class CurrencyClient(BaseClient):
         :return:
         """
 
-        return await self._request(f"{await self.get_base_url()}?base={base}")
+        return await self._request(self.get_base_url(), {"base": base})
@@ -4,29 +4,40 @@
 from http import HTTPStatus
 from typing import Optional
 
-import aiohttp
-
-from clients.base import BaseClient
-from logger import trace_config
+from clients.base import BaseClient, RateLimitedClient
 from settings import API_KEY_OPENWEATHER
 
 
-class WeatherClient(BaseClient):
+class WeatherClient(RateLimitedClient, BaseClient):
     """
     Реализация функций для взаимодействия с внешним сервисом-провайдером данных о погоде.
     """
 
-    async def get_base_url(self) -> str:
+    def get_base_url(self) -> str:
         return "https://api.openweathermap.org/data/2.5/weather"
 
-    async def _request(self, endpoint: str) -> Optional[dict]:
+    async def _request(
+        self, endpoint: str, params: Optional[dict] = None
+    ) -> Optional[dict]:
+
+        for _ in range(self.retry_attempts + 1):
+            async with self._limited() as window:
+                session = await self.get_session()
+                async with session.get(endpoint, params=params) as response:
+                    result = (
+                        await response.json()
+                        if response.status == HTTPStatus.OK
+                        else None
+                    )
+
+                # ожидание и снижение нагрузки при исчерпании квоты запросов
+                await self._throttle(response, window)
 
-        async with aiohttp.ClientSession(trace_configs=[trace_config]) as session:
-            async with session.get(endpoint) as response:
-                if response.status == HTTPStatus.OK:
-                    return await response.json()
+            # после ожидания отклоненный из-за ограничения частоты запрос повторяется
+            if response.status != HTTPStatus.TOO_MANY_REQUESTS:
+                return result
 
-                return None
+        return None
 
     async def get_weather(self, location: str) -> Optional[dict]:
         """
@@ -37,5 +48,6 @@ class WeatherClient(BaseClient):
         """
 
         return await self._request(
-            f"{await self.get_base_url()}?units=metric&q={location}&appid={API_KEY_OPENWEATHER}"
+            self.get_base_url(),
+            {"units": "metric", "q": location, "appid": API_KEY_OPENWEATHER or ""},
         )
@@ -1,13 +1,21 @@
 """
 Базовые функции сборщиков информации о странах.
 """
+import asyncio
+import contextlib
+import os
 import time
 from abc import ABC, abstractmethod
-from typing import Iterable, Any, Optional
+from pathlib import Path
+from typing import Iterable, Any, Callable, Optional
 
 import aiofiles
 import aiofiles.os
 
+# прочитанные из файлов данные: путь к файлу -> (состояние файла, данные),
+# где состояние файла – номер индексного дескриптора, время изменения и размер
+_read_cache: dict[str, tuple[tuple[int, int, int], Any]] = {}
+
 
 class BaseCollector(ABC):
     """
@@ -20,24 +28,79 @@ class BaseCollector(ABC):
 
     @staticmethod
     @abstractmethod
-    async def get_file_path(**kwargs: Any) -> str:
+    def get_file_path(**kwargs: Any) -> str:
         ...
 
     @staticmethod
     @abstractmethod
-    async def get_cache_ttl() -> int:
+    def get_cache_ttl() -> int:
         ...
 
-    async def cache_invalid(self, **kwargs: Any) -> bool:
+    @staticmethod
+    async def read_file(file_path: str) -> bytes:
+        """
+        Чтение содержимого файла в байтах.
+
+        Чтение локального файла выполняется одним блокирующим вызовом в отдельном потоке,
+        что дешевле поблочного чтения через пул потоков aiofiles.
+
+        :param file_path: Путь к файлу
+        :return:
+        """
+
+        return await asyncio.to_thread(Path(file_path).read_bytes)
+
+    @classmethod
+    async def read_cached(
+        cls, file_path: str, decode: Callable[[bytes], Any]
+    ) -> Optional[Any]:
+        """
+        Чтение и декодирование содержимого файла с сохранением результата в памяти.
+
+        Повторное чтение и декодирование выполняется только при изменении файла.
+
+        :param file_path: Путь к файлу
+        :param decode: Функция декодирования содержимого файла
+        :return:
+        """
+
+        stat = await aiofiles.os.stat(file_path)
+        # замена файла (os.replace) меняет индексный дескриптор даже при совпадении
+        # времени изменения, размер дополнительно учитывает грубую точность mtime
+        state = (stat.st_ino, stat.st_mtime_ns, stat.st_size)
+        if (cached := _read_cache.get(file_path)) and cached[0] == state:
+            return cached[1]
+
+        content = await cls.read_file(file_path)
+        result = decode(content) if content else None
+        _read_cache[file_path] = (state, result)
+
+        return result
+
+    @staticmethod
+    async def write_file(file_path: str, content: bytes) -> None:
+        """
+        Атомарная запись содержимого в файл.
+
+        Данные записываются во временный файл, который затем заменяет целевой,
+        поэтому при сбое во время записи в кэше не останется частично записанного файла.
+
+        :param file_path: Путь к файлу
+        :param content: Содержимое для записи
+        :return:
+        """
+
+        await asyncio.to_thread(_atomic_write, file_path, content)
+
+    async def cache_invalid(self, file_path: str) -> bool:
         """
         Проверка необходимости актуализации данных в кэше.
         Если True, то необходимо актуализировать данные в кэше, иначе брать данные из кэша.
 
+        :param file_path: Путь к файлу кэша
         :return: bool
         """
 
-        file_path = await self.get_file_path(**kwargs)
-
         if (
             # проверка существования файла
             # (если файл не существует)
@@ -50,8 +113,37 @@ class BaseCollector(ABC):
             # и времени последнего изменения файла
             # (или если файл существует и не пустой, но данные в нем уже устарели)
             or (time.time() - await aiofiles.os.path.getmtime(file_path))
-            > await self.get_cache_ttl()
+            > self.get_cache_ttl()
         ):
             return True
 
         return False
+
+
+def _atomic_write(file_path: str, content: bytes) -> None:
+    """
+    Запись содержимого во временный файл с последующей заменой целевого файла.
+
+    :param file_path: Путь к файлу
+    :param content: Содержимое для записи
+    :return:
+    """
+
+    tmp_path = f"{file_path}.tmp"
+    fd = os.open(tmp_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+    try:
+        try:
+            view = memoryview(content)
+            while view:
+                written = os.write(fd, view)
+                view = view[written:]
+            os.fsync(fd)
+        finally:
+            os.close(fd)
+
+        os.replace(tmp_path, file_path)
+    except OSError:
+        # временный файл не должен оставаться после неудачной записи
+        with contextlib.suppress(FileNotFoundError):
+            os.unlink(tmp_path)
+        raise
@@ -5,12 +5,21 @@
 from __future__ import annotations
 
 import asyncio
-import json
+import logging
+import os
 from typing import Any, Optional, FrozenSet
 
-import aiofiles
-import aiofiles.os
+import msgspec
+import orjson
 
+try:
+    import uvloop
+except ImportError:  # pragma: no cover
+    UVLOOP_AVAILABLE = False
+else:
+    UVLOOP_AVAILABLE = True
+
+from clients.base import BaseClient
 from clients.country import CountryClient
 from clients.currency import CurrencyClient
 from clients.weather import WeatherClient
@@ -19,7 +28,6 @@ from collectors.models import (
     LocationDTO,
     CountryDTO,
     CurrencyRatesDTO,
-    CurrencyInfoDTO,
     WeatherInfoDTO,
 )
 from settings import (
@@ -27,9 +35,63 @@ from settings import (
     CACHE_TTL_COUNTRY,
     CACHE_TTL_CURRENCY_RATES,
     CACHE_TTL_WEATHER,
+    HTTP_CONCURRENCY,
 )
 
 
+class _WeatherMain(msgspec.Struct):
+    """
+    Используемые поля блока "main" ответа сервиса о погоде.
+    """
+
+    temp: float
+    pressure: int
+    humidity: int
+
+
+class _WeatherWind(msgspec.Struct):
+    """
+    Используемые поля блока "wind" ответа сервиса о погоде.
+    """
+
+    speed: float
+
+
+class _WeatherCondition(msgspec.Struct):
+    """
+    Используемые поля элемента блока "weather" ответа сервиса о погоде.
+    """
+
+    description: str
+
+
+class _WeatherPayload(msgspec.Struct):
+    """
+    Схема ответа сервиса о погоде, ограниченная используемыми полями.
+    """
+
+    main: _WeatherMain
+    wind: _WeatherWind
+    weather: list[_WeatherCondition]
+
+
+class _CountryLocation(msgspec.Struct):
+    """
+    Используемые поля данных о стране для формирования локации.
+    """
+
+    capital: str
+    alpha2code: str
+
+
+# декодеры JSON с заранее подготовленной схемой моделей данных
+_countries_decoder = msgspec.json.Decoder(list[CountryDTO])
+_currency_rates_decoder = msgspec.json.Decoder(CurrencyRatesDTO)
+# поля ответа о погоде, отсутствующие в схеме, пропускаются без создания объектов Python
+_weather_decoder = msgspec.json.Decoder(_WeatherPayload)
+_locations_decoder = msgspec.json.Decoder(list[_CountryLocation])
+
+
 class CountryCollector(BaseCollector):
     """
     Сбор информации о странах (географическое описание).
@@ -39,34 +101,33 @@ class CountryCollector(BaseCollector):
         self.client = CountryClient()
 
     @staticmethod
-    async def get_file_path(**kwargs: Any) -> str:
+    def get_file_path(**kwargs: Any) -> str:
         return f"{MEDIA_PATH}/country.json"
 
     @staticmethod
-    async def get_cache_ttl() -> int:
+    def get_cache_ttl() -> int:
         return CACHE_TTL_COUNTRY
 
     async def collect(self, **kwargs: Any) -> Optional[FrozenSet[LocationDTO]]:
-        if await self.cache_invalid():
+        file_path = self.get_file_path()
+        content: Optional[bytes] = None
+        if await self.cache_invalid(file_path):
             # если кэш уже невалиден, то актуализируем его
             result = await self.client.get_countries()
             if result:
-                result_str = json.dumps(result)
-                async with aiofiles.open(await self.get_file_path(), mode="w") as file:
-                    await file.write(result_str)
+                content = orjson.dumps(result)
+                await self.write_file(file_path, content)
 
-        # получение данных из кэша
-        async with aiofiles.open(await self.get_file_path(), mode="r") as file:
-            content = await file.read()
+        if content is None:
+            # получение данных из кэша, если актуальные данные не были получены
+            content = await self.read_file(file_path)
 
-        result = json.loads(content)
-        if result:
+        # из данных о странах декодируются только столица и код страны
+        items = _locations_decoder.decode(content) if content else None
+        if items:
             locations = frozenset(
-                LocationDTO(
-                    capital=item["capital"],
-                    alpha2code=item["alpha2code"],
-                )
-                for item in result
+                LocationDTO(capital=item.capital, alpha2code=item.alpha2code)
+                for item in items
             )
 
             return locations
@@ -81,34 +142,8 @@ class CountryCollector(BaseCollector):
         :return:
         """
 
-        async with aiofiles.open(await cls.get_file_path(), mode="r") as file:
-            content = await file.read()
-
-        if content:
-            items = json.loads(content)
-            result_list = []
-            for item in items:
-                result_list.append(
-                    CountryDTO(
-                        capital=item["capital"],
-                        alpha2code=item["alpha2code"],
-                        alt_spellings=item["alt_spellings"],
-                        currencies={
-                            CurrencyInfoDTO(code=currency["code"])
-                            for currency in item["currencies"]
-                        },
-                        flag=item["flag"],
-                        languages=item["languages"],
-                        name=item["name"],
-                        population=item["population"],
-                        subregion=item["subregion"],
-                        timezones=item["timezones"],
-                    )
-                )
-
-            return result_list
-
-        return None
+        # декодирование сразу в модели данных, без промежуточных словарей
+        return await cls.read_cached(cls.get_file_path(), _countries_decoder.decode)
 
 
 class CurrencyRatesCollector(BaseCollector):
@@ -120,21 +155,20 @@ class CurrencyRatesCollector(BaseCollector):
         self.client = CurrencyClient()
 
     @staticmethod
-    async def get_file_path(**kwargs: Any) -> str:
+    def get_file_path(**kwargs: Any) -> str:
         return f"{MEDIA_PATH}/currency_rates.json"
 
     @staticmethod
-    async def get_cache_ttl() -> int:
+    def get_cache_ttl() -> int:
         return CACHE_TTL_CURRENCY_RATES
 
     async def collect(self, **kwargs: Any) -> None:
-        if await self.cache_invalid():
+        file_path = self.get_file_path()
+        if await self.cache_invalid(file_path):
             # если кэш уже невалиден, то актуализируем его
             result = await self.client.get_rates()
             if result:
-                result_str = json.dumps(result)
-                async with aiofiles.open(await self.get_file_path(), mode="w") as file:
-                    await file.write(result_str)
+                await self.write_file(file_path, orjson.dumps(result))
 
     @classmethod
     async def read(cls) -> Optional[CurrencyRatesDTO]:
@@ -144,19 +178,9 @@ class CurrencyRatesCollector(BaseCollector):
         :return:
         """
 
-        async with aiofiles.open(await cls.get_file_path(), mode="r") as file:
-            content = await file.read()
-
-        if content:
-            result = json.loads(content)
-
-            return CurrencyRatesDTO(
-                base=result["base"],
-                date=result["date"],
-                rates=result["rates"],
-            )
-
-        return None
+        return await cls.read_cached(
+            cls.get_file_path(), _currency_rates_decoder.decode
+        )
 
 
 class WeatherCollector(BaseCollector):
@@ -168,35 +192,44 @@ class WeatherCollector(BaseCollector):
         self.client = WeatherClient()
 
     @staticmethod
-    async def get_file_path(filename: str = "", **kwargs: Any) -> str:
+    def get_file_path(filename: str = "", **kwargs: Any) -> str:
         return f"{MEDIA_PATH}/weather/{filename}.json"
 
     @staticmethod
-    async def get_cache_ttl() -> int:
+    def get_cache_ttl() -> int:
         return CACHE_TTL_WEATHER
 
     async def collect(
         self, locations: FrozenSet[LocationDTO] = frozenset(), **kwargs: Any
     ) -> None:
 
-        target_dir_path = f"{MEDIA_PATH}/weather"
-        # если целевой директории еще не существует, то она создается
-        if not await aiofiles.os.path.exists(target_dir_path):
-            await aiofiles.os.mkdir(target_dir_path)
-
-        for location in locations:
-            filename = f"{location.capital}_{location.alpha2code}".lower()
-            if await self.cache_invalid(filename=filename):
-                # если кэш уже невалиден, то актуализируем его
-                result = await self.client.get_weather(
-                    f"{location.capital},{location.alpha2code}"
+        # ограничение количества одновременно выполняемых запросов
+        semaphore = asyncio.Semaphore(HTTP_CONCURRENCY)
+
+        async def collect_location(location: LocationDTO) -> None:
+            async with semaphore:
+                file_path = self.get_file_path(location.weather_key)
+                if await self.cache_invalid(file_path):
+                    # если кэш уже невалиден, то актуализируем его
+                    result = await self.client.get_weather(
+                        f"{location.capital},{location.alpha2code}"
+                    )
+                    if result:
+                        await self.write_file(file_path, orjson.dumps(result))
+
+        results = await asyncio.gather(
+            *(collect_location(location) for location in locations),
+            return_exceptions=True,
+        )
+        # ошибка получения данных для одной локации не прерывает сбор для остальных
+        for location, result in zip(locations, results):
+            if isinstance(result, Exception):
+                logging.warning(
+                    "Не удалось получить данные о погоде для %s,%s: %r",
+                    location.capital,
+                    location.alpha2code,
+                    result,
                 )
-                if result:
-                    result_str = json.dumps(result)
-                    async with aiofiles.open(
-                        await self.get_file_path(filename), mode="w"
-                    ) as file:
-                        await file.write(result_str)
 
     @classmethod
     async def read(cls, location: LocationDTO) -> Optional[WeatherInfoDTO]:
@@ -207,18 +240,17 @@ class WeatherCollector(BaseCollector):
         :return:
         """
 
-        filename = f"{location.capital}_{location.alpha2code}".lower()
-        async with aiofiles.open(await cls.get_file_path(filename), mode="r") as file:
-            content = await file.read()
+        content = await cls.read_file(cls.get_file_path(location.weather_key))
+
+        if content:
+            result = _weather_decoder.decode(content)
 
-        result = json.loads(content)
-        if result:
             return WeatherInfoDTO(
-                temp=result["main"]["temp"],
-                pressure=result["main"]["pressure"],
-                humidity=result["main"]["humidity"],
-                wind_speed=result["wind"]["speed"],
-                description=result["weather"][0]["description"],
+                temp=result.main.temp,
+                pressure=result.main.pressure,
+                humidity=result.main.humidity,
+                wind_speed=result.wind.speed,
+                description=result.weather[0].description,
             )
 
         return None
@@ -226,19 +258,36 @@ class WeatherCollector(BaseCollector):
 
 class Collectors:
     @staticmethod
-    async def gather() -> tuple:
-        return await asyncio.gather(
-            CurrencyRatesCollector().collect(),
-            CountryCollector().collect(),
-        )
+    async def gather() -> None:
+        async def collect_locations() -> None:
+            # сбор данных о погоде возможен только после получения данных о странах
+            locations = await CountryCollector().collect()
+            await WeatherCollector().collect(locations or frozenset())
 
-    @staticmethod
-    def collect() -> None:
-        loop = asyncio.get_event_loop()
         try:
-            results = loop.run_until_complete(Collectors.gather())
-            loop.run_until_complete(WeatherCollector().collect(results[1]))
-            loop.run_until_complete(loop.shutdown_asyncgens())
-
+            # сбор данных о курсах валют не зависит от остальных этапов
+            results = await asyncio.gather(
+                CurrencyRatesCollector().collect(),
+                collect_locations(),
+                return_exceptions=True,
+            )
         finally:
-            loop.close()
+            # закрытие общей сессии для HTTP-запросов перед остановкой цикла событий,
+            # после завершения всех этапов (в том числе при ошибке одного из них)
+            await BaseClient.close_session()
+
+        for result in results:
+            if isinstance(result, BaseException):
+                raise result
+
+    @staticmethod
+    def collect() -> None:
+        # целевые директории создаются один раз перед началом сбора данных
+        os.makedirs(f"{MEDIA_PATH}/weather", exist_ok=True)
+
+        # при наличии используется более производительный цикл событий uvloop,
+        # глобальная политика цикла событий при этом не изменяется
+        if UVLOOP_AVAILABLE:
+            uvloop.run(Collectors.gather())
+        else:
+            asyncio.run(Collectors.gather())
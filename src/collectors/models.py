@@ -1,20 +1,18 @@
 """
 Описание моделей данных (DTO).
-"""
-
-from pydantic import Field, BaseModel
 
+Модели, заполняемые из сохраненных данных, описаны структурами msgspec:
+они декодируются из JSON напрямую, без промежуточных словарей.
+"""
 
-class HashableBaseModel(BaseModel):
-    """
-    Добавление хэшируемости для моделей.
-    """
+from dataclasses import dataclass, field
+from typing import Optional
 
-    def __hash__(self) -> int:
-        return hash((type(self),) + tuple(self.__dict__.values()))
+import msgspec
 
 
-class LocationDTO(HashableBaseModel):
+@dataclass(frozen=True, slots=True)
+class LocationDTO:
     """
     Модель локации для получения сведений о погоде.
 
@@ -27,10 +25,22 @@ class LocationDTO(HashableBaseModel):
     """
 
     capital: str
-    alpha2code: str = Field(min_length=2, max_length=2)  # country alpha‑2 code
+    alpha2code: str  # country alpha‑2 code
+    # ключ (имя файла) для хранения данных о погоде в локации
+    weather_key: str = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        if len(self.alpha2code) != 2:
+            raise ValueError(
+                f"alpha2code must be exactly 2 characters long: {self.alpha2code!r}"
+            )
+
+        object.__setattr__(
+            self, "weather_key", f"{self.capital}_{self.alpha2code}".lower()
+        )
 
 
-class CurrencyInfoDTO(HashableBaseModel):
+class CurrencyInfoDTO(msgspec.Struct, frozen=True):
     """
     Модель данных о валюте.
 
@@ -44,7 +54,7 @@ class CurrencyInfoDTO(HashableBaseModel):
     code: str
 
 
-class LanguagesInfoDTO(HashableBaseModel):
+class LanguagesInfoDTO(msgspec.Struct, frozen=True):
     """
     Модель данных о языке.
 
@@ -60,7 +70,7 @@ class LanguagesInfoDTO(HashableBaseModel):
     native_name: str
 
 
-class CountryDTO(BaseModel):
+class CountryDTO(msgspec.Struct):
     """
     Модель данных о стране.
 
@@ -108,7 +118,7 @@ class CountryDTO(BaseModel):
     timezones: list[str]
 
 
-class CurrencyRatesDTO(BaseModel):
+class CurrencyRatesDTO(msgspec.Struct):
     """
     Модель данных о курсах валют.
 
@@ -128,7 +138,7 @@ class CurrencyRatesDTO(BaseModel):
     rates: dict[str, float]
 
 
-class WeatherInfoDTO(BaseModel):
+class WeatherInfoDTO(msgspec.Struct):
     """
     Модель данных о погоде.
 
@@ -150,7 +160,7 @@ class WeatherInfoDTO(BaseModel):
     description: str
 
 
-class LocationInfoDTO(BaseModel):
+class LocationInfoDTO(msgspec.Struct):
     """
     Модель данных для представления общей информации о месте.
 
@@ -199,5 +209,5 @@ class LocationInfoDTO(BaseModel):
     """
 
     location: CountryDTO
-    weather: WeatherInfoDTO
+    weather: Optional[WeatherInfoDTO]
     currency_rates: dict[str, float]
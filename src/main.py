@@ -28,8 +28,8 @@ async def process_input(location: str) -> None:
     if location_info:
         lines = await Renderer(location_info).render()
 
-        for line in lines:
-            click.secho(line, fg="green")
+        # вывод всех строк одной операцией записи
+        click.secho("\n".join(lines), fg="green")
     else:
         click.secho("Информация отсутствует.", fg="yellow")
 
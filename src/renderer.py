@@ -6,6 +6,9 @@ from decimal import ROUND_HALF_UP, Decimal
 
 from collectors.models import LocationInfoDTO
 
+# точность округления курсов валют
+_EXP = Decimal(".01")
+
 
 class Renderer:
     """
@@ -35,9 +38,21 @@ class Renderer:
             f"Языки: {await self._format_languages()}",
             f"Население страны: {await self._format_population()} чел.",
             f"Курсы валют: {await self._format_currency_rates()}",
-            f"Погода: {self.location_info.weather.temp} °C",
+            f"Погода: {await self._format_weather()}",
         )
 
+    async def _format_weather(self) -> str:
+        """
+        Форматирование информации о погоде.
+
+        :return:
+        """
+
+        if self.location_info.weather is None:
+            return "нет данных"
+
+        return f"{self.location_info.weather.temp} °C"
+
     async def _format_languages(self) -> str:
         """
         Форматирование информации о языках.
@@ -67,7 +82,9 @@ class Renderer:
         :return:
         """
 
+        # Decimal создается из строкового представления числа,
+        # чтобы округление выполнялось от видимого значения, а не от двоичного
         return ", ".join(
-            f"{currency} = {Decimal(rates).quantize(exp=Decimal('.01'), rounding=ROUND_HALF_UP)} руб."
+            f"{currency} = {Decimal(str(rates)).quantize(exp=_EXP, rounding=ROUND_HALF_UP)} руб."
             for currency, rates in self.location_info.currency_rates.items()
         )
@@ -27,3 +27,6 @@ CACHE_TTL_COUNTRY: int = int(os.getenv("CACHE_TTL_COUNTRY", "31_536_000"))
 CACHE_TTL_CURRENCY_RATES: int = int(os.getenv("CACHE_TTL_CURRENCY_RATES", "86_400"))
 # время актуальности данных о погоде (в секундах), по умолчанию ~ три часа
 CACHE_TTL_WEATHER: int = int(os.getenv("CACHE_TTL_WEATHER", "10_700"))
+
+# максимальное количество одновременно выполняемых HTTP-запросов
+HTTP_CONCURRENCY: int = int(os.getenv("HTTP_CONCURRENCY", "32"))
@@ -20,7 +20,7 @@ class TestClientCountry:
         return CountryClient()
 
     async def test_get_base_url(self, client):
-        assert await client.get_base_url() == self.base_url
+        assert client.get_base_url() == self.base_url
 
     async def test_get_countries(self, mocker, client):
         mocker.patch("clients.country.CountryClient._request")
@@ -1,3 +1,123 @@
 """
 Тестирование функций клиента для получения информации о погоде.
 """
+
+from types import SimpleNamespace
+
+import pytest
+
+from clients.weather import WeatherClient
+
+
+class FakeResponse:
+    """
+    Ответ внешнего сервиса для тестирования.
+    """
+
+    def __init__(self, status, headers=None, payload=None):
+        self.status = status
+        self.headers = headers or {}
+        self.payload = payload
+
+    async def json(self):
+        return self.payload
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *args):
+        return None
+
+
+@pytest.mark.asyncio
+class TestClientWeather:
+    """
+    Тестирование клиента для получения информации о погоде.
+    """
+
+    base_url = "https://api.openweathermap.org/data/2.5/weather"
+
+    @pytest.fixture
+    def client(self):
+        return WeatherClient()
+
+    async def test_get_base_url(self, client):
+        assert client.get_base_url() == self.base_url
+
+    async def test_get_weather(self, mocker, client):
+        mocker.patch("clients.weather.API_KEY_OPENWEATHER", "key")
+        mocker.patch("clients.weather.WeatherClient._request")
+        await client.get_weather("Saint Helier,JE")
+        client._request.assert_called_once_with(
+            self.base_url, {"units": "metric", "q": "Saint Helier,JE", "appid": "key"}
+        )
+
+    async def test_throttle_decrease(self, mocker, client):
+        sleep = mocker.patch("clients.base.asyncio.sleep")
+        response = SimpleNamespace(status=429, headers={"Retry-After": "3"})
+
+        await client._throttle(response, client._window)
+
+        sleep.assert_called_once_with(3.0)
+        assert client._concurrency_limit == client.max_concurrency / 2
+
+    async def test_throttle_remaining(self, mocker, client):
+        sleep = mocker.patch("clients.base.asyncio.sleep")
+        response = SimpleNamespace(status=200, headers={"X-RateLimit-Remaining": "1"})
+
+        await client._throttle(response, client._window)
+
+        sleep.assert_called_once_with(client.default_retry_after)
+        assert client._concurrency_limit == client.max_concurrency / 2
+
+    async def test_throttle_increase(self, mocker, client):
+        mocker.patch("clients.base.asyncio.sleep")
+        client._concurrency_limit = 1.0
+        response = SimpleNamespace(status=200, headers={})
+
+        await client._throttle(response, client._window)
+        assert client._concurrency_limit == 1.5
+
+        client._concurrency_limit = float(client.max_concurrency)
+        await client._throttle(response, client._window)
+        assert client._concurrency_limit == client.max_concurrency
+
+    async def test_throttle_once_per_window(self, mocker, client):
+        mocker.patch("clients.base.asyncio.sleep")
+        response = SimpleNamespace(status=429, headers={})
+        window = client._window
+
+        # ответы на запросы из одного окна уменьшают лимит однократно
+        for _ in range(5):
+            await client._throttle(response, window)
+
+        assert client._concurrency_limit == client.max_concurrency / 2
+
+        await client._throttle(response, client._window)
+        assert client._concurrency_limit == client.max_concurrency / 4
+
+    async def test_request_retry(self, mocker, client):
+        sleep = mocker.patch("clients.base.asyncio.sleep")
+        session = SimpleNamespace(
+            get=mocker.Mock(
+                side_effect=[
+                    FakeResponse(429, {"Retry-After": "2"}),
+                    FakeResponse(200, payload={"main": {}}),
+                ]
+            )
+        )
+        mocker.patch.object(client, "get_session", return_value=session)
+
+        assert await client._request(self.base_url) == {"main": {}}
+        assert session.get.call_count == 2
+        sleep.assert_called_once_with(2.0)
+
+    async def test_request_retry_exhausted(self, mocker, client):
+        mocker.patch("clients.base.asyncio.sleep")
+        session = SimpleNamespace(
+            get=mocker.Mock(side_effect=[FakeResponse(429), FakeResponse(429)])
+        )
+        mocker.patch.object(client, "get_session", return_value=session)
+
+        assert await client._request(self.base_url) is None
+        assert session.get.call_count == client.retry_attempts + 1
@@ -0,0 +1,36 @@
+"""
+Тестирование базовых функций сборщиков информации.
+"""
+
+import pytest
+
+from collectors.base import BaseCollector
+
+
+@pytest.mark.asyncio
+class TestBaseCollector:
+    """
+    Тестирование базового сборщика информации.
+    """
+
+    async def test_write_file(self, tmp_path):
+        file_path = tmp_path / "currency_rates.json"
+        file_path.write_bytes(b"{}")
+
+        await BaseCollector.write_file(str(file_path), b'{"base": "RUB"}')
+
+        # целевой файл заменен, временный файл не остался
+        assert file_path.read_bytes() == b'{"base": "RUB"}'
+        assert not (tmp_path / "currency_rates.json.tmp").exists()
+
+    async def test_write_file_failure(self, mocker, tmp_path):
+        file_path = tmp_path / "currency_rates.json"
+        file_path.write_bytes(b"{}")
+        mocker.patch("collectors.base.os.fsync", side_effect=OSError)
+
+        with pytest.raises(OSError):
+            await BaseCollector.write_file(str(file_path), b'{"base": "RUB"}')
+
+        # целевой файл не изменен, временный файл удален
+        assert file_path.read_bytes() == b"{}"
+        assert not (tmp_path / "currency_rates.json.tmp").exists()
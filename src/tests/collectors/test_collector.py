@@ -0,0 +1,41 @@
+"""
+Тестирование функций запуска сбора информации.
+"""
+
+import asyncio
+
+import pytest
+
+from collectors.collector import Collectors
+
+
+@pytest.mark.asyncio
+class TestCollectors:
+    """
+    Тестирование запуска сбора информации.
+    """
+
+    async def test_gather_failure(self, mocker):
+        events = []
+
+        async def collect_currency():
+            await asyncio.sleep(0.01)
+            events.append("currency")
+
+        mocker.patch(
+            "collectors.collector.CurrencyRatesCollector.collect",
+            side_effect=collect_currency,
+        )
+        mocker.patch(
+            "collectors.collector.CountryCollector.collect", side_effect=RuntimeError
+        )
+        mocker.patch(
+            "collectors.collector.BaseClient.close_session",
+            side_effect=lambda: events.append("close"),
+        )
+
+        with pytest.raises(RuntimeError):
+            await Collectors.gather()
+
+        # сессия закрывается только после завершения сбора данных о курсах валют
+        assert events == ["currency", "close"]
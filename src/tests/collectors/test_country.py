@@ -1,3 +1,77 @@
 """
 Тестирование функций сбора информации о странах.
 """
+
+import pytest
+
+from collectors.collector import CountryCollector
+from collectors.models import (
+    CountryDTO,
+    CurrencyInfoDTO,
+    LanguagesInfoDTO,
+    LocationDTO,
+)
+
+
+@pytest.mark.asyncio
+class TestCollectorCountry:
+    """
+    Тестирование сборщика информации о странах.
+    """
+
+    content = (
+        b'[{"capital": "Mariehamn", "alpha2code": "AX",'
+        b' "alt_spellings": ["AX", "Aaland"],'
+        b' "currencies": [{"code": "EUR", "name": "Euro", "symbol": "\\u20ac"}],'
+        b' "flag": "http://assets.promptapi.com/flags/AX.svg",'
+        b' "languages": [{"name": "Swedish", "native_name": "svenska"}],'
+        b' "name": "\\u00c5land Islands", "population": 28875,'
+        b' "subregion": "Northern Europe", "timezones": ["UTC+02:00"]}]'
+    )
+
+    @pytest.fixture
+    def collector(self, mocker, tmp_path):
+        mocker.patch("collectors.collector.MEDIA_PATH", str(tmp_path))
+        (tmp_path / "country.json").write_bytes(self.content)
+
+        return CountryCollector()
+
+    async def test_collect(self, mocker, collector):
+        mocker.patch.object(collector, "cache_invalid", return_value=False)
+
+        assert await collector.collect() == frozenset(
+            {LocationDTO(capital="Mariehamn", alpha2code="AX")}
+        )
+
+    async def test_collect_refresh(self, mocker, tmp_path, collector):
+        mocker.patch.object(collector, "cache_invalid", return_value=True)
+        mocker.patch.object(
+            collector.client,
+            "get_countries",
+            return_value=[{"capital": "Mariehamn", "alpha2code": "AX"}],
+        )
+        read_file = mocker.spy(collector, "read_file")
+
+        assert await collector.collect() == frozenset(
+            {LocationDTO(capital="Mariehamn", alpha2code="AX")}
+        )
+        read_file.assert_not_called()
+        assert (tmp_path / "country.json").read_bytes() == (
+            b'[{"capital":"Mariehamn","alpha2code":"AX"}]'
+        )
+
+    async def test_read(self, collector):
+        assert await CountryCollector.read() == [
+            CountryDTO(
+                capital="Mariehamn",
+                alpha2code="AX",
+                alt_spellings=["AX", "Aaland"],
+                currencies={CurrencyInfoDTO(code="EUR")},
+                flag="http://assets.promptapi.com/flags/AX.svg",
+                languages={LanguagesInfoDTO(name="Swedish", native_name="svenska")},
+                name="Åland Islands",
+                population=28875,
+                subregion="Northern Europe",
+                timezones=["UTC+02:00"],
+            )
+        ]
@@ -1,3 +1,46 @@
 """
 Тестирование функций сбора информации о курсах валют.
 """
+
+import os
+
+import pytest
+
+from collectors.collector import CurrencyRatesCollector
+from collectors.models import CurrencyRatesDTO
+
+
+@pytest.mark.asyncio
+class TestCollectorCurrency:
+    """
+    Тестирование сборщика информации о курсах валют.
+    """
+
+    async def test_read(self, mocker, tmp_path):
+        mocker.patch("collectors.collector.MEDIA_PATH", str(tmp_path))
+        file_path = tmp_path / "currency_rates.json"
+        file_path.write_bytes(
+            b'{"base": "RUB", "date": "2022-09-14", "rates": {"EUR": 0.016503}}'
+        )
+        read_file = mocker.spy(CurrencyRatesCollector, "read_file")
+
+        expected = CurrencyRatesDTO(
+            base="RUB", date="2022-09-14", rates={"EUR": 0.016503}
+        )
+        assert await CurrencyRatesCollector.read() == expected
+        # повторное чтение неизмененного файла выполняется из памяти
+        assert await CurrencyRatesCollector.read() == expected
+        assert read_file.call_count == 1
+
+        # замена файла с тем же временем изменения и размером
+        mtime_ns = file_path.stat().st_mtime_ns
+        tmp_file_path = tmp_path / "currency_rates.json.tmp"
+        tmp_file_path.write_bytes(
+            b'{"base": "RUB", "date": "2022-09-15", "rates": {"EUR": 0.016504}}'
+        )
+        os.utime(tmp_file_path, ns=(mtime_ns, mtime_ns))
+        os.replace(tmp_file_path, file_path)
+        assert await CurrencyRatesCollector.read() == CurrencyRatesDTO(
+            base="RUB", date="2022-09-15", rates={"EUR": 0.016504}
+        )
+        assert read_file.call_count == 2
@@ -0,0 +1,28 @@
+"""
+Тестирование моделей данных.
+"""
+
+import pytest
+
+from collectors.models import LocationDTO
+
+
+class TestLocationDTO:
+    """
+    Тестирование модели данных о местоположении.
+    """
+
+    @pytest.mark.parametrize("alpha2code", ["A", "ABC"])
+    def test_alpha2code_length(self, alpha2code):
+        with pytest.raises(ValueError):
+            LocationDTO(capital="Mariehamn", alpha2code=alpha2code)
+
+    def test_weather_key(self):
+        location = LocationDTO(capital="Mariehamn", alpha2code="AX")
+        assert location.weather_key == "mariehamn_ax"
+
+        # ключ кэша погоды не участвует в сравнении и вычислении хэша
+        other = LocationDTO(capital="Mariehamn", alpha2code="AX")
+        object.__setattr__(other, "weather_key", "other")
+        assert location == other
+        assert hash(location) == hash(other)
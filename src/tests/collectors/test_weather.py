@@ -1,3 +1,75 @@
 """
 Тестирование функций сбора информации о погоде.
 """
+
+import aiohttp
+import pytest
+
+from collectors.collector import WeatherCollector
+from collectors.models import LocationDTO, WeatherInfoDTO
+
+
+@pytest.mark.asyncio
+class TestCollectorWeather:
+    """
+    Тестирование сборщика информации о погоде.
+    """
+
+    @pytest.fixture
+    def location(self):
+        return LocationDTO(capital="Mariehamn", alpha2code="AX")
+
+    async def test_read(self, mocker, tmp_path, location):
+        mocker.patch("collectors.collector.MEDIA_PATH", str(tmp_path))
+        (tmp_path / "weather").mkdir()
+        (tmp_path / "weather" / "mariehamn_ax.json").write_bytes(
+            b'{"main": {"temp": 13.92, "pressure": 1023, "humidity": 54},'
+            b' "wind": {"speed": 4.63}, "weather": [{"description": "scattered clouds"}]}'
+        )
+
+        assert await WeatherCollector.read(location) == WeatherInfoDTO(
+            temp=13.92,
+            pressure=1023,
+            humidity=54,
+            wind_speed=4.63,
+            description="scattered clouds",
+        )
+
+    async def test_read_coerce(self, mocker, tmp_path, location):
+        mocker.patch("collectors.collector.MEDIA_PATH", str(tmp_path))
+        (tmp_path / "weather").mkdir()
+        (tmp_path / "weather" / "mariehamn_ax.json").write_bytes(
+            b'{"main": {"temp": 14, "pressure": 1023, "humidity": 54},'
+            b' "wind": {"speed": 4}, "weather": [{"description": "clear sky"}]}'
+        )
+
+        weather = await WeatherCollector.read(location)
+
+        assert isinstance(weather.temp, float)
+        assert isinstance(weather.wind_speed, float)
+
+    async def test_collect_failure(self, mocker, tmp_path, caplog, location):
+        caplog.set_level("WARNING")
+        mocker.patch("collectors.collector.MEDIA_PATH", str(tmp_path))
+        (tmp_path / "weather").mkdir()
+        collector = WeatherCollector()
+        mocker.patch.object(collector, "cache_invalid", return_value=True)
+
+        async def get_weather(location):
+            if location.startswith("Tórshavn"):
+                raise aiohttp.ClientError
+
+            return {"main": {"temp": 13.92}}
+
+        mocker.patch.object(collector.client, "get_weather", side_effect=get_weather)
+
+        await collector.collect(
+            frozenset({location, LocationDTO(capital="Tórshavn", alpha2code="FO")})
+        )
+
+        # ошибка для одной локации не мешает сохранению данных для остальных
+        assert (tmp_path / "weather" / "mariehamn_ax.json").read_bytes() == (
+            b'{"main":{"temp":13.92}}'
+        )
+        assert not (tmp_path / "weather" / "tórshavn_fo.json").exists()
+        assert "Tórshavn,FO" in caplog.text
@@ -1,3 +1,33 @@
 """
 Тестирование функций генерации выходных данных.
 """
+
+from types import SimpleNamespace
+
+import pytest
+
+from renderer import Renderer
+
+
+@pytest.mark.asyncio
+class TestRenderer:
+    """
+    Тестирование генерации выходных данных.
+    """
+
+    async def test_format_currency_rates(self):
+        renderer = Renderer(
+            SimpleNamespace(currency_rates={"EUR": 60.595, "USD": 2.675})
+        )
+
+        assert (
+            await renderer._format_currency_rates()
+            == "EUR = 60.60 руб., USD = 2.68 руб."
+        )
+
+    async def test_format_weather(self):
+        renderer = Renderer(SimpleNamespace(weather=SimpleNamespace(temp=13.92)))
+        assert await renderer._format_weather() == "13.92 °C"
+
+        renderer = Renderer(SimpleNamespace(weather=None))
+        assert await renderer._format_weather() == "нет данных"